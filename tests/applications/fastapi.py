@@ -21,6 +21,11 @@ async def child(request: Request) -> str:
         return "Hello, child!"
 
 
+@application.get("/path-parameters/{parameter}", response_class=PlainTextResponse)
+async def path_parameters(parameter: str) -> str:
+    return f"Hello, {parameter}!"
+
+
 @application.get("/exception")
 async def exception() -> typing.NoReturn:
     raise RuntimeError("Oops")
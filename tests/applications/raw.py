@@ -1,51 +1,72 @@
 from ddtrace import Tracer
 from starlette.types import Receive, Scope, Send
 
+_PATH_PARAMETERS_PREFIX = "/path-parameters/"
+
+# Response messages are immutable for a given status/body, so build them once
+# at import time instead of allocating fresh dicts on every request.
+_START_200 = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [[b"content-type", b"text/plain"]],
+}
+_START_500 = {
+    "type": "http.response.start",
+    "status": 500,
+    "headers": [[b"content-type", b"text/plain"]],
+}
+_BODY_HELLO_WORLD = {"type": "http.response.body", "body": b"Hello, world!"}
+_BODY_HELLO_CHILD = {"type": "http.response.body", "body": b"Hello, child!"}
+
+# Pre-encoded fragments for the dynamic path-parameters body.
+_BODY_HELLO_PREFIX = b"Hello, "
+_BODY_HELLO_SUFFIX = b"!"
+
 
 async def hello_world(scope: Scope, receive: Receive, send: Send) -> None:
-    assert scope["type"] == "http"
-    await send(
-        {
-            "type": "http.response.start",
-            "status": 200,
-            "headers": [[b"content-type", b"text/plain"]],
-        }
-    )
-    await send({"type": "http.response.body", "body": b"Hello, world!"})
+    await send(_START_200)
+    await send(_BODY_HELLO_WORLD)
 
 
 async def child(scope: Scope, receive: Receive, send: Send) -> None:
-    assert scope["type"] == "http"
     tracer: Tracer = scope["ddtrace_asgi.tracer"]
     with tracer.trace("asgi.request.child", resource="child") as span:
         span.set_tag("hello", "world")
-        await send(
-            {
-                "type": "http.response.start",
-                "status": 200,
-                "headers": [[b"content-type", b"text/plain"]],
-            }
-        )
-        await send({"type": "http.response.body", "body": b"Hello, child!"})
+        await send(_START_200)
+        await send(_BODY_HELLO_CHILD)
 
 
 async def exception(scope: Scope, receive: Receive, send: Send) -> None:
     exc = RuntimeError("Oops")
-    await send(
-        {
-            "type": "http.response.start",
-            "status": 500,
-            "headers": [[b"content-type", b"text/plain"]],
-        }
-    )
+    await send(_START_500)
     await send({"type": "http.response.body", "body": str(exc).encode()})
     raise exc
 
 
+async def path_parameters(scope: Scope, receive: Receive, send: Send) -> None:
+    # The dispatcher guarantees there is no slash after the prefix, so the
+    # last segment is the parameter - no need to split the full path.
+    parameter = scope["path"].rpartition("/")[2]
+    # URL path segments are ASCII by the URL grammar, so skip the general
+    # UTF-8 codec and join pre-encoded fragments instead of building a str.
+    body = b"".join((_BODY_HELLO_PREFIX, parameter.encode("ascii"), _BODY_HELLO_SUFFIX))
+    await send(_START_200)
+    await send({"type": "http.response.body", "body": body})
+
+
+# Static paths dispatch via a hash lookup rather than chained string compares.
+_ROUTES = {"/child": child, "/exception": exception}
+
+
 async def application(scope: Scope, receive: Receive, send: Send) -> None:
-    if scope["path"] == "/child":
-        await child(scope, receive, send)
-    elif scope["path"] == "/exception":
-        await exception(scope, receive, send)
-    else:
-        await hello_world(scope, receive, send)
+    path = scope["path"]
+    handler = _ROUTES.get(path)
+    if handler is not None:
+        await handler(scope, receive, send)
+        return
+    if path.startswith(_PATH_PARAMETERS_PREFIX):
+        parameter = path[len(_PATH_PARAMETERS_PREFIX) :]
+        if parameter and "/" not in parameter:
+            await path_parameters(scope, receive, send)
+            return
+    await hello_world(scope, receive, send)
@@ -7,10 +7,15 @@ from starlette.responses import PlainTextResponse, Response
 
 application = Starlette()
 
+# Responses are immutable once built (body bytes + raw headers), so encode
+# the static ones a single time at import instead of on every request.
+_HELLO_WORLD = PlainTextResponse("Hello, world!")
+_HELLO_CHILD = PlainTextResponse("Hello, child!")
+
 
 @application.route("/example")
 async def example(request: Request) -> Response:
-    return PlainTextResponse("Hello, world!")
+    return _HELLO_WORLD
 
 
 @application.route("/child")
@@ -18,7 +23,12 @@ async def child(request: Request) -> Response:
     tracer: Tracer = request["ddtrace_asgi.tracer"]
     with tracer.trace("asgi.request.child", resource="child") as span:
         span.set_tag("hello", "world")
-        return PlainTextResponse("Hello, child!")
+        return _HELLO_CHILD
+
+
+@application.route("/path-parameters/{parameter}")
+async def path_parameters(request: Request) -> Response:
+    return PlainTextResponse(f"Hello, {request.path_params['parameter']}!")
 
 
 @application.route("/exception")
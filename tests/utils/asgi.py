@@ -1,12 +1,18 @@
+from types import MappingProxyType
+
 from starlette.types import Message, Receive, Scope, Send
 
-mock_http_scope = {
-    "type": "http",
-    "headers": [],
-    "method": "GET",
-    "path": "/",
-    "query_string": b"",
-}
+# Read-only so tests cannot leak mutations into each other. Copy before
+# passing to an app: the middleware writes to the scope it receives.
+mock_http_scope = MappingProxyType(
+    {
+        "type": "http",
+        "headers": [],
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+    }
+)
 
 
 async def mock_receive() -> Message: